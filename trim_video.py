@@ -5,25 +5,177 @@ import re
 import os
 import sys
 import json
+import asyncio
+import functools
+import queue
+import threading
+import weakref
+import signal
+import _thread
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ===== CONFIG =====
 SILENCE_THRESHOLD = "-35dB"
 MIN_SILENCE_DURATION = 0.65    # seconds
 
-# Global log file handle
-log_file = None
+# Global log sink (console + log file writer) for batch runs
+log_sink = None
+
+# Per-file log buffer used inside worker processes (see _run_buffered)
+log_buffer = None
+
+# Running ffmpeg/ffprobe children of this process, terminated on Ctrl-C,
+# SIGTERM or SIGHUP
+active_procs = weakref.WeakSet()
+
+# Set once Ctrl-C is seen; pool workers then skip any file still queued
+interrupted = False
+
+# Threads per ffmpeg invocation (None lets ffmpeg decide)
+ffmpeg_threads = None
+MAX_FFMPEG_THREADS = 64
+
+# Environment for ffmpeg/ffprobe, built once; the C locale keeps decimal
+# points in timestamps independent of the user's locale
+FFMPEG_ENV = {**os.environ, "LC_ALL": "C"}
+
+# Invariant ffmpeg argv prefixes; per-call options such as -threads follow
+# the prefix and precede -i. -nostdin keeps parallel ffmpegs from sharing
+# (and switching to raw mode) the terminal's stdin
+FFMPEG_DETECT_PREFIX = ("ffmpeg", "-nostdin", "-nostats", "-loglevel", "info")
+FFMPEG_TRIM_PREFIX = ("ffmpeg", "-nostdin", "-y", "-loglevel", "error", "-nostats", "-progress", "pipe:1")
+
+SILENCE_START_RE = re.compile(r"silence_start: (-?[0-9.]+)")
+SILENCE_END_RE = re.compile(r"silence_end: ([0-9.]+)")
+
+# SS, MM:SS or HH:MM:SS; the hours group only matches when minutes are present
+TIME_RE = re.compile(r"^(?:(?:(\d+):)?(\d+):)?(\d+(?:\.\d*)?|\.\d+)$")
+
+class _LogSink:
+    """Queue-fed writer thread that prints messages and appends them to a log file.
+
+    Messages are written in the order they are queued; the file is only
+    flushed once the queue drains instead of after every line.
+    """
 
-SILENCE_RE = re.compile(
-    r"silence_start: ([0-9.]+)|silence_end: ([0-9.]+)"
-)
+    def __init__(self, path):
+        self.file = open(path, "w", encoding="utf-8")
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._drain, daemon=True)
+        self.thread.start()
+
+    def write(self, message):
+        self.queue.put(message)
+
+    def _drain(self):
+        while True:
+            message = self.queue.get()
+            if message is None:
+                break
+            print(message)
+            self.file.write(message + "\n")
+            if self.queue.empty():
+                self.file.flush()
+
+    def close(self):
+        """Write any pending messages, then close the log file"""
+        self.queue.put(None)
+        self.thread.join()
+        self.file.close()
 
 def log(message=""):
     """Print to console and optionally write to log file"""
-    print(message)
-    if log_file:
-        log_file.write(message + "\n")
-        log_file.flush()
+    if log_buffer is not None:
+        log_buffer.append(message)
+    elif log_sink is not None:
+        log_sink.write(message)
+    else:
+        print(message)
+
+def log_lines(result):
+    """Write the (filename, lines) result of a worker to the log in one block"""
+    _, lines = result
+    for line in lines:
+        log(line)
+
+def default_jobs():
+    """Default number of parallel workers for directory processing"""
+    return max(1, (os.cpu_count() or 1) // 2)
+
+def _ffmpeg_threads_per_invocation(n_workers):
+    """Split the CPU cores evenly between n_workers concurrent ffmpeg processes"""
+    return min(MAX_FFMPEG_THREADS, max(1, (os.cpu_count() or n_workers) // n_workers))
+
+def parse_ffmpeg_threads(value):
+    """Parse and validate an ffmpeg thread count"""
+    try:
+        threads = int(value)
+    except ValueError:
+        threads = 0
+    if not 1 <= threads <= MAX_FFMPEG_THREADS:
+        raise ValueError(f"Invalid ffmpeg thread count: {value}. Use an integer from 1 to {MAX_FFMPEG_THREADS}")
+    return threads
+
+def ffmpeg_thread_args():
+    """Return the -threads option to insert after the ffmpeg prefix (empty if unset)"""
+    if ffmpeg_threads is None:
+        return []
+    return ["-threads", str(ffmpeg_threads)]
+
+def popen_child(cmd, **kwargs):
+    """Start an ffmpeg child in its own session and track it for shutdown.
+
+    A separate session keeps the terminal's Ctrl-C away from ffmpeg so that
+    terminate_children() controls how it stops.
+    """
+    proc = subprocess.Popen(cmd, start_new_session=True, env=FFMPEG_ENV, **kwargs)
+    active_procs.add(proc)
+    return proc
+
+def terminate_children(timeout=2):
+    """SIGTERM every running child, then SIGKILL any still alive after timeout"""
+    procs = [proc for proc in active_procs if proc.poll() is None]
+    for proc in procs:
+        proc.terminate()
+    for proc in procs:
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+def _raise_interrupt(signum, frame):
+    global interrupted
+    # Raise only once: a second signal arriving mid-cleanup would abort
+    # terminate_children() and leave partial outputs behind
+    if interrupted:
+        return
+    interrupted = True
+    raise KeyboardInterrupt
+
+def install_signal_handlers():
+    """Route Ctrl-C, SIGTERM and SIGHUP through a single KeyboardInterrupt.
+
+    ffmpeg children run in their own session and never see signals sent to
+    this process group, so every way of stopping us must reach
+    terminate_children().
+    """
+    for name in ("SIGINT", "SIGTERM", "SIGHUP"):
+        sig = getattr(signal, name, None)
+        if sig is not None:
+            signal.signal(sig, _raise_interrupt)
 
 def format_time(seconds):
     """Convert seconds to HH:MM:SS.mm format"""
@@ -37,80 +189,184 @@ def format_time(seconds):
 
 def parse_time(time_str):
     """Parse time string to seconds. Supports formats: SS, MM:SS, HH:MM:SS, or decimal seconds"""
-    try:
-        # Try parsing as plain seconds (e.g., "123.45")
-        return float(time_str)
-    except ValueError:
-        pass
-    
-    # Try parsing as HH:MM:SS or MM:SS
-    parts = time_str.split(':')
-    try:
-        if len(parts) == 2:  # MM:SS
-            return int(parts[0]) * 60 + float(parts[1])
-        elif len(parts) == 3:  # HH:MM:SS
-            return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
-    except ValueError:
-        pass
-    
-    raise ValueError(f"Invalid time format: {time_str}. Use SS, MM:SS, or HH:MM:SS")
-
-def run(cmd):
-    return subprocess.run(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        env={**os.environ, "LC_ALL": "C"}
-    )
+    m = TIME_RE.match(time_str.strip())
+    if not m:
+        raise ValueError(f"Invalid time format: {time_str}. Use SS, MM:SS, or HH:MM:SS")
+    hours, minutes, seconds = m.groups()
+    return int(hours or 0) * 3600 + int(minutes or 0) * 60 + float(seconds)
 
-def detect_all_silences(video):
-    """Return list of all silence periods as [(start, end, duration), ...]"""
-    proc = run([
-        "ffmpeg",
+def silence_detect_cmd(video):
+    """Build the ffmpeg silencedetect command for a video"""
+    # Only decode the first audio track; video/subtitle/data streams are
+    # dropped and per-frame stats are suppressed to keep stderr small
+    return [
+        *FFMPEG_DETECT_PREFIX,
+        *ffmpeg_thread_args(),
         "-i", str(video),
+        "-vn", "-sn", "-dn",
+        "-map", "0:a:0",
         "-af", f"silencedetect=n={SILENCE_THRESHOLD}:d={MIN_SILENCE_DURATION}",
         "-f", "null",
         "-"
-    ])
-
-    silences = []
-    current_start = None
-    
-    for line in proc.stderr.splitlines():
-        m = SILENCE_RE.search(line)
-        if m:
-            if m.group(1):  # silence_start
-                current_start = float(m.group(1))
-            elif m.group(2) and current_start is not None:  # silence_end
-                end = float(m.group(2))
-                duration = end - current_start
-                silences.append((current_start, end, duration))
-                current_start = None
-    
-    # Handle case where silence extends to end of file (no silence_end)
-    if current_start is not None:
-        silences.append((current_start, None, None))
+    ]
+
+class _SilenceParser:
+    """Incrementally pair silence_start/silence_end lines from ffmpeg stderr"""
+
+    def __init__(self):
+        self.silences = []
+        self.current_start = None
+
+    def feed(self, line):
+        # Cheap substring check skips the regex for almost every line
+        if "silence_" not in line:
+            return
+        if "silence_start:" in line:
+            m = SILENCE_START_RE.search(line)
+            if m:
+                # A file that opens in silence can report a slightly negative start
+                self.current_start = max(0.0, float(m.group(1)))
+        elif "silence_end:" in line and self.current_start is not None:
+            m = SILENCE_END_RE.search(line)
+            if m:
+                end = float(m.group(1))
+                duration = end - self.current_start
+                self.silences.append((self.current_start, end, duration))
+                self.current_start = None
+
+    def result(self):
+        """Return [(start, end, duration), ...]; a silence running to EOF has end=None"""
+        if self.current_start is not None:
+            return self.silences + [(self.current_start, None, None)]
+        return self.silences
+
+def detect_all_silences(video):
+    """Return list of all silence periods as [(start, end, duration), ...], or None if ffmpeg fails"""
+    parser = _SilenceParser()
     
-    return silences
+    # Parse stderr as it is produced instead of buffering the whole output
+    with popen_child(
+        silence_detect_cmd(video),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1
+    ) as proc:
+        for line in proc.stderr:
+            parser.feed(line)
+    
+    if proc.returncode != 0:
+        return None
+    return parser.result()
+
+async def _detect_all_silences_async(video):
+    """Async variant of detect_all_silences; returns None if ffmpeg fails"""
+    proc = await asyncio.create_subprocess_exec(
+        *silence_detect_cmd(video),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        env=FFMPEG_ENV,
+        start_new_session=True
+    )
+    parser = _SilenceParser()
+    try:
+        async for line in proc.stderr:
+            parser.feed(line.decode("utf-8", errors="replace"))
+        await proc.wait()
+    except (asyncio.CancelledError, KeyboardInterrupt):
+        # Interrupted: ffmpeg runs in its own session, so stop it here
+        # (SIGTERM, then SIGKILL if it is still alive after 2s)
+        if proc.returncode is None:
+            proc.terminate()
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=2)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+        raise
+    
+    if proc.returncode != 0:
+        return None
+    return parser.result()
+
+async def _gather_detect(videos, jobs):
+    """Run silence detection on videos concurrently (at most `jobs` at a time) and cache results.
+
+    Returns {video: ("short", duration) | ("failed", None)} for the files that
+    were not actually scanned, so the per-file pass can report them.
+    """
+    sem = asyncio.Semaphore(jobs)
+    outcomes = {}
+    
+    async def detect_and_cache(video):
+        # Same short-file check and caching as get_silences_with_cache
+        async with sem:
+            duration = await asyncio.to_thread(_short_video_duration, video)
+            if duration is not None:
+                silences = []
+                outcomes[video] = ("short", duration)
+            else:
+                silences = await _detect_all_silences_async(video)
+                if silences is None:
+                    outcomes[video] = ("failed", None)
+        cache_detection_result(video, silences)
+    
+    await asyncio.gather(*(detect_and_cache(video) for video in videos))
+    return outcomes
+
+def _probe_duration(video):
+    """Return the container duration in seconds via ffprobe, or None if unknown"""
+    try:
+        proc = subprocess.run([
+            "ffprobe",
+            "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "csv=p=0",
+            str(video)
+        ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+           env=FFMPEG_ENV, start_new_session=True)
+        return float(proc.stdout.strip())
+    except (OSError, ValueError):
+        return None
 
-def get_cache_path(video_path):
-    """Get the cache file path for a video"""
-    video = pathlib.Path(video_path).resolve()
+def _short_video_duration(video):
+    """Return the duration if video is too short to hold a silence worth trimming, else None"""
+    duration = _probe_duration(video)
+    if duration is not None and duration < MIN_SILENCE_DURATION * 2:
+        return duration
+    return None
+
+def get_cache_path(video):
+    """Get the cache file path for a video (an already-resolved pathlib.Path)"""
     return video.parent / f".{video.stem}_silence_cache.json"
 
+def _dump_json(data):
+    """Serialize data to compact UTF-8 JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+def _load_json(raw):
+    """Parse JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 def save_silences_to_cache(video_path, silences):
     """Save silence detection results to cache file"""
     cache_path = get_cache_path(video_path)
+    st = os.stat(video_path)
     cache_data = {
         "video": str(video_path),
         "threshold": SILENCE_THRESHOLD,
         "min_duration": MIN_SILENCE_DURATION,
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
         "timestamp": datetime.now().isoformat(),
         "silences": silences
     }
-    with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(cache_data, f, indent=2)
+    with open(cache_path, "wb") as f:
+        f.write(_dump_json(cache_data))
     return cache_path
 
 def load_silences_from_cache(video_path):
@@ -120,37 +376,69 @@ def load_silences_from_cache(video_path):
         return None
     
     try:
-        with open(cache_path, "r", encoding="utf-8") as f:
-            cache_data = json.load(f)
+        with open(cache_path, "rb") as f:
+            cache_data = _load_json(f.read())
         
-        # Check if cache matches current settings
+        # Check if cache matches current settings and the video is unchanged
+        st = os.stat(video_path)
         if (cache_data.get("threshold") == SILENCE_THRESHOLD and
-            cache_data.get("min_duration") == MIN_SILENCE_DURATION):
+            cache_data.get("min_duration") == MIN_SILENCE_DURATION and
+            cache_data.get("size") == st.st_size and
+            cache_data.get("mtime_ns") == st.st_mtime_ns):
             # Convert lists back to tuples
             silences = [tuple(s) for s in cache_data.get("silences", [])]
             return silences
-    except (json.JSONDecodeError, KeyError):
+    except (ValueError, KeyError):  # includes json/orjson JSONDecodeError
         pass
     
     return None
 
-def get_silences_with_cache(video_path, use_cache=True):
-    """Get silences, using cache if available and valid"""
-    video = pathlib.Path(video_path).resolve()
+def cache_detection_result(video, silences):
+    """Cache a finished detection and return it.
+
+    Empty results are cached too (the cache is keyed on size/mtime); None,
+    meaning ffmpeg failed, is not cached and is returned unchanged.
+    """
+    if silences is None:
+        return None
+    save_silences_to_cache(video, silences)
+    return silences
+
+def get_silences_with_cache(video, use_cache=True, use_cache_only=False, prewarm_outcome=None):
+    """Get silences, using cache if available and valid.
+
+    Returns None if detection failed (already logged), or on a cache miss
+    with use_cache_only instead of running ffmpeg. prewarm_outcome is this
+    file's entry from _gather_detect(), if any.
+    """
+    # The prewarm pass already skipped or failed this file; report that
+    # rather than "Using cached silence data" or detecting it again
+    if prewarm_outcome is not None:
+        kind, duration = prewarm_outcome
+        if kind == "short":
+            log(f"  Video too short ({duration:.2f}s) → skipping silence detection")
+            return []
+        log("  ✗ Silence detection failed (ffmpeg error)")
+        return None
     
-    if use_cache:
+    if use_cache or use_cache_only:
         cached = load_silences_from_cache(video)
         if cached is not None:
             log(f"  Using cached silence data")
             return cached
     
-    log(f"  Detecting silences (threshold={SILENCE_THRESHOLD}, min_duration={MIN_SILENCE_DURATION}s)...")
-    silences = detect_all_silences(video)
+    if use_cache_only:
+        return None
     
-    # Save to cache for future use
-    if silences:
-        save_silences_to_cache(video, silences)
+    duration = _short_video_duration(video)
+    if duration is not None:
+        log(f"  Video too short ({duration:.2f}s) → skipping silence detection")
+        return cache_detection_result(video, [])
     
+    log(f"  Detecting silences (threshold={SILENCE_THRESHOLD}, min_duration={MIN_SILENCE_DURATION}s)...")
+    silences = cache_detection_result(video, detect_all_silences(video))
+    if silences is None:
+        log("  ✗ Silence detection failed (ffmpeg error)")
     return silences
 
 def detect_last_silence_start(video):
@@ -160,6 +448,49 @@ def detect_last_silence_start(video):
         return silences[-1][0]
     return None
 
+def run_with_progress(cmd, total, desc):
+    """Run an ffmpeg command that writes -progress to stdout, showing a progress bar.
+
+    The bar covers `total` seconds of output and is only shown when tqdm is
+    installed and output is not being captured by a pool worker. Returns
+    ffmpeg's exit code.
+    """
+    bar = None
+    if tqdm is not None and log_buffer is None:
+        bar = tqdm(total=round(total, 2), desc=desc, unit="s", leave=False)
+    
+    with popen_child(cmd, stdout=subprocess.PIPE, text=True, bufsize=1) as proc:
+        for line in proc.stdout:
+            key, _, value = line.strip().partition("=")
+            # out_time_ms is in microseconds too, despite its name
+            if bar is not None and key in ("out_time_us", "out_time_ms") and value.isdigit():
+                bar.n = min(round(int(value) / 1_000_000, 2), bar.total)
+                bar.refresh()
+    
+    if bar is not None:
+        bar.close()
+    return proc.returncode
+
+def partial_path(output):
+    """Temporary path ffmpeg writes to; moved to `output` only once ffmpeg succeeds"""
+    return output.with_name(f".{output.stem}.partial{output.suffix}")
+
+def finalize_outputs(outputs, success):
+    """Move finished partial files into place, or delete them after a failure or interrupt.
+
+    This keeps truncated files out of trimmed/, where they would otherwise be
+    skipped as already processed on the next run.
+    """
+    for output in outputs:
+        partial = partial_path(output)
+        try:
+            if success:
+                os.replace(partial, output)
+            else:
+                partial.unlink()
+        except FileNotFoundError:
+            pass
+
 def print_silence_report(video, silences):
     """Print a detailed report of all detected silence periods"""
     log(f"\n{'='*60}")
@@ -188,9 +519,8 @@ def print_silence_report(video, silences):
     log(f"  Video will be trimmed at this point.\n")
 
 
-def trim_at_time(mkv_path, cut_time, out_dir):
-    """Trim a video at a specific time point"""
-    mkv = pathlib.Path(mkv_path).resolve()
+def trim_at_time(mkv, cut_time, out_dir):
+    """Trim a video at a specific time point (mkv is an already-resolved pathlib.Path)"""
     output = out_dir / mkv.name
     
     # Skip if output already exists
@@ -201,35 +531,31 @@ def trim_at_time(mkv_path, cut_time, out_dir):
     log(f"Processing: {mkv.name}")
     log(f"  Cutting at: {format_time(cut_time)}")
     
-    subprocess.run([
-        "ffmpeg",
-        "-loglevel", "error",
-        "-i", str(mkv),
-        "-to", f"{cut_time:.2f}",
-        "-c", "copy",
-        str(output)
-    ])
+    returncode = None
+    try:
+        returncode = run_with_progress([
+            *FFMPEG_TRIM_PREFIX,
+            *ffmpeg_thread_args(),
+            "-i", str(mkv),
+            "-to", f"{cut_time:.2f}",
+            "-c", "copy",
+            str(partial_path(output))
+        ], cut_time, mkv.name)
+    finally:
+        finalize_outputs([output], returncode == 0)
+    
+    if returncode != 0:
+        log(f"  ✗ ffmpeg failed (exit {returncode})")
+        return
     
     log(f"  ✓ Trimmed at {format_time(cut_time)} → {output}")
 
 
-def split_by_silence(mkv_path, out_dir, preview_only=False):
-    """Split a video into multiple parts based on silence gaps"""
-    mkv = pathlib.Path(mkv_path).resolve()
-    base_name = mkv.stem
-    ext = mkv.suffix
-    
-    log(f"Processing: {mkv.name}")
-    
-    silences = get_silences_with_cache(mkv)
-    
-    if not silences:
-        log("  No silence detected → cannot split")
-        return
-    
-    # Show silence report
-    print_silence_report(mkv, silences)
-    
+def compute_segments(silences):
+    """Return [(start, end), ...] segments split at the middle of each silence gap.
+
+    A silence that extends to EOF ends the last segment at its start.
+    """
     # Calculate split points (use middle of each silence gap)
     split_points = []
     for start, end, duration in silences:
@@ -247,11 +573,34 @@ def split_by_silence(mkv_path, out_dir, preview_only=False):
     for i, point in enumerate(split_points):
         segments.append((prev_point, point))
         prev_point = point
+    return segments
+
+
+def split_by_silence(mkv, out_dir, preview_only=False):
+    """Split a video into multiple parts based on silence gaps (mkv is an already-resolved pathlib.Path)"""
+    base_name = mkv.stem
+    ext = mkv.suffix
+    
+    log(f"Processing: {mkv.name}")
+    
+    silences = get_silences_with_cache(mkv)
+    
+    if silences is None:
+        return
+    
+    if not silences:
+        log("  No silence detected → cannot split")
+        return
+    
+    # Show silence report
+    print_silence_report(mkv, silences)
+    
+    segments = compute_segments(silences)
     
     # Determine number of digits needed for naming
     num_digits = max(2, len(str(len(segments))))
     
-    log(f"\n  Will create {len(segments)} segment(s):")
+    log(f"\n  Will create {len(segments)} segment(s) (stream copy: each boundary snaps to the next keyframe):")
     for i, (start, end) in enumerate(segments, 1):
         output_name = f"{base_name}_{i:0{num_digits}d}{ext}"
         log(f"    {i:0{num_digits}d}: {format_time(start)} → {format_time(end)}  [{output_name}]")
@@ -260,45 +609,88 @@ def split_by_silence(mkv_path, out_dir, preview_only=False):
         log("\n  Preview mode - no files created")
         return
     
+    output_names = [f"{base_name}_{i:0{num_digits}d}{ext}" for i in range(1, len(segments) + 1)]
+    existing = [name for name in output_names if (out_dir / name).exists()]
+    
+    # Skip if a previous split already produced its segments. Split points
+    # that snap past the last keyframe never get a file, so a complete run
+    # can leave the trailing names missing; otherwise regenerate the full
+    # set, since the segment muxer writes every segment in one pass
+    if existing and existing == output_names[:len(existing)]:
+        log(f"\n  Skipping: {len(existing)} of {len(segments)} segments already exist")
+        return
+    for name in existing:
+        log(f"    Overwriting {name} (regenerating all segments)")
+    
     log(f"\n  Creating segments...")
     
-    for i, (start, end) in enumerate(segments, 1):
-        output_name = f"{base_name}_{i:0{num_digits}d}{ext}"
-        output = out_dir / output_name
-        
-        # Skip if output already exists
-        if output.exists():
-            log(f"    Skipping {output_name} (already exists)")
-            continue
-        
-        subprocess.run([
-            "ffmpeg",
-            "-loglevel", "error",
+    # Demux the input once and let the segment muxer cut at every split
+    # point; input-side -to drops everything after the last split point
+    if len(segments) > 1:
+        segment_times = ",".join(f"{end:.2f}" for _, end in segments[:-1])
+        # The segment muxer expands % sequences across the whole output path;
+        # this yields partial_path() of each segment name
+        pattern = (str(out_dir / f".{base_name}").replace("%", "%%")
+                   + f"_%0{num_digits}d" + f".partial{ext}".replace("%", "%%"))
+        output_args = [
+            "-f", "segment",
+            "-segment_times", segment_times,
+            "-segment_start_number", "1",
+            "-reset_timestamps", "1",
+            pattern
+        ]
+    else:
+        output_args = [str(partial_path(out_dir / output_names[0]))]
+    
+    returncode = None
+    try:
+        returncode = run_with_progress([
+            *FFMPEG_TRIM_PREFIX,
+            *ffmpeg_thread_args(),
+            "-to", f"{segments[-1][1]:.2f}",
             "-i", str(mkv),
-            "-ss", f"{start:.2f}",
-            "-to", f"{end:.2f}",
+            "-map", "0",
             "-c", "copy",
-            str(output)
-        ])
-        
-        log(f"    ✓ Created {output_name}")
+            *output_args
+        ], segments[-1][1], mkv.name)
+    finally:
+        finalize_outputs([out_dir / name for name in output_names], returncode == 0)
+    
+    if returncode != 0:
+        log(f"    ✗ ffmpeg failed (exit {returncode})")
+        return
     
-    log(f"\n  ✓ Split complete: {len(segments)} segments created")
+    created = 0
+    for name in output_names:
+        if (out_dir / name).exists():
+            log(f"    ✓ Created {name}")
+            created += 1
+        else:
+            log(f"    - {name} not created (split point fell after the last keyframe)")
+    
+    log(f"\n  ✓ Split complete: {created} of {len(segments)} segments created")
 
 
-def process_file(mkv_path, out_dir, preview_only=False):
-    """Process a single .mkv file"""
-    mkv = pathlib.Path(mkv_path).resolve()
+def process_file(mkv, out_dir, preview_only=False, prewarm_outcomes=None):
+    """Process a single .mkv file (mkv is an already-resolved pathlib.Path)"""
     output = out_dir / mkv.name
     
-    # Skip if output already exists (unless preview mode)
-    if not preview_only and output.exists():
+    # Skip if output already exists, before doing any silence work
+    output_exists = output.exists()
+    if not preview_only and output_exists:
         log(f"Skipping: {mkv.name} (already exists in trimmed folder)")
         return
     
     log(f"Processing: {mkv.name}")
 
-    silences = get_silences_with_cache(mkv)
+    # Previewing an already-trimmed file only reports cached results
+    silences = get_silences_with_cache(mkv, use_cache_only=output_exists,
+                                       prewarm_outcome=(prewarm_outcomes or {}).get(mkv))
+    
+    if silences is None:
+        if output_exists:
+            log("  Already trimmed and no cached silence data → skipped")
+        return
     
     if not silences:
         log("  No silence detected → skipped")
@@ -312,21 +704,110 @@ def process_file(mkv_path, out_dir, preview_only=False):
     
     silence_start = silences[-1][0]
 
-    subprocess.run([
-        "ffmpeg",
-        "-loglevel", "error",
-        "-i", str(mkv),
-        "-to", f"{silence_start:.2f}",
-        "-c", "copy",
-        str(output)
-    ])
+    returncode = None
+    try:
+        returncode = run_with_progress([
+            *FFMPEG_TRIM_PREFIX,
+            *ffmpeg_thread_args(),
+            "-i", str(mkv),
+            "-to", f"{silence_start:.2f}",
+            "-c", "copy",
+            str(partial_path(output))
+        ], silence_start, mkv.name)
+    finally:
+        finalize_outputs([output], returncode == 0)
+
+    if returncode != 0:
+        log(f"  ✗ ffmpeg failed (exit {returncode})")
+        return
 
     log(f"  ✓ Trimmed at {format_time(silence_start)} → {output}")
 
 
-def process_directory(input_dir, preview_only=False):
+def list_mkv_files(input_path):
+    """Return the .mkv files directly inside input_path, sorted by path.
+
+    input_path must already be resolved; symlinked entries are resolved to
+    their targets here, so every returned path is fully resolved.
+    """
+    # scandir reports the entry type from the directory listing itself,
+    # so only symlinks (followed, as glob did) need a stat()
+    with os.scandir(input_path) as entries:
+        paths = sorted(
+            (e.path, e.is_symlink()) for e in entries
+            if e.name.lower().endswith(".mkv") and e.is_file()
+        )
+    return [pathlib.Path(p).resolve() if link else pathlib.Path(p) for p, link in paths]
+
+
+def _init_worker(threads, stop_event):
+    """Pool initializer: propagate the ffmpeg thread count and shutdown signal to workers"""
+    global ffmpeg_threads
+    ffmpeg_threads = threads
+    install_signal_handlers()
+    threading.Thread(target=_watch_stop, args=(stop_event,), daemon=True).start()
+
+
+def _watch_stop(stop_event):
+    """Worker thread: once the main process asks to stop, interrupt the running file"""
+    global interrupted
+    stop_event.wait()
+    # Only interrupt while a file is in progress; an idle worker just skips
+    # its remaining files via the interrupted flag. interrupt_main() goes
+    # through _raise_interrupt(), so a worker that already got the signal
+    # itself is not interrupted twice.
+    if log_buffer is not None:
+        _thread.interrupt_main()
+    else:
+        interrupted = True
+    # Killing ffmpeg closes its pipes, so the main thread wakes up and raises
+    terminate_children()
+
+
+def _run_buffered(func, mkv, **kwargs):
+    """Pool worker entry point: run func with log output captured; returns (filename, lines)"""
+    global log_buffer, interrupted
+    if interrupted:
+        raise KeyboardInterrupt
+    log_buffer = []
+    try:
+        func(mkv, **kwargs)
+        return (mkv.name, log_buffer)
+    except KeyboardInterrupt:
+        interrupted = True
+        terminate_children()
+        raise
+    finally:
+        log_buffer = None
+
+
+def run_jobs(func, mkv_files, jobs, **kwargs):
+    """Run func(mkv, **kwargs) over mkv_files with up to `jobs` processes, logging results in order"""
+    # Serial runs log live; only parallel workers need per-file buffering
+    if jobs <= 1:
+        for mkv in mkv_files:
+            func(mkv, **kwargs)
+        return
+    
+    worker = functools.partial(_run_buffered, func, **kwargs)
+    stop_event = multiprocessing.Event()
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(ffmpeg_threads, stop_event)) as ex:
+        try:
+            for result in ex.map(worker, mkv_files):
+                log_lines(result)
+        except KeyboardInterrupt:
+            # Tell workers to stop their own ffmpeg children (a SIGTERM or
+            # SIGHUP may have reached only this process), and drop queued
+            # files instead of waiting for them
+            stop_event.set()
+            ex.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
+def process_directory(input_dir, preview_only=False, jobs=None):
     """Process all .mkv files in the given directory"""
-    global log_file
+    global log_sink, ffmpeg_threads
     input_path = pathlib.Path(input_dir).resolve()
     
     if not input_path.exists():
@@ -337,13 +818,17 @@ def process_directory(input_dir, preview_only=False):
         print(f"Error: '{input_path}' is not a directory")
         return
     
+    if jobs is None:
+        jobs = default_jobs()
+    if ffmpeg_threads is None:
+        ffmpeg_threads = _ffmpeg_threads_per_invocation(jobs)
+    
     # Create trimmed subdirectory in the input directory
     out_dir = input_path / "trimmed"
     if not preview_only:
         out_dir.mkdir(exist_ok=True)
     
-    mkv_files = list(input_path.glob("*.mkv"))
-    mkv_files.sort()  # Sort files for consistent ordering
+    mkv_files = list_mkv_files(input_path)
     
     if not mkv_files:
         print(f"No .mkv files found in '{input_path}'")
@@ -352,25 +837,39 @@ def process_directory(input_dir, preview_only=False):
     # Create log file for batch processing
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_path = input_path / f"trim_video_{timestamp}.log"
-    log_file = open(log_path, "w", encoding="utf-8")
+    log_sink = _LogSink(log_path)
     
     log(f"Trim Video Log - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     log(f"Directory: {input_path}")
     log(f"Found {len(mkv_files)} .mkv file(s)")
+    log(f"Parallel jobs: {jobs} (ffmpeg threads per job: {ffmpeg_threads})")
     if preview_only:
         log("Mode: Preview only (no files will be modified)\n")
     else:
         log(f"Output directory: {out_dir}\n")
     
-    for mkv in mkv_files:
-        process_file(mkv, out_dir, preview_only)
+    # Close the sink even on error so queued messages still reach the log
+    try:
+        # Prewarm the silence cache concurrently for files that still need
+        # detection; the per-file work below then only reads the cache and trims
+        to_detect = [
+            mkv for mkv in mkv_files
+            if not (out_dir / mkv.name).exists() and load_silences_from_cache(mkv) is None
+        ]
+        prewarm_outcomes = {}
+        if jobs > 1 and to_detect:
+            log(f"Detecting silences for {len(to_detect)} file(s), {jobs} at a time...\n")
+            prewarm_outcomes = asyncio.run(_gather_detect(to_detect, jobs))
+        
+        run_jobs(process_file, mkv_files, jobs, out_dir=out_dir, preview_only=preview_only,
+                 prewarm_outcomes=prewarm_outcomes)
 
-    log("\n" + "="*60)
-    log("Done.")
-    log(f"Log saved to: {log_path}")
-    
-    log_file.close()
-    log_file = None
+        log("\n" + "="*60)
+        log("Done.")
+        log(f"Log saved to: {log_path}")
+    finally:
+        log_sink.close()
+        log_sink = None
     
     print(f"\n📄 Log saved to: {log_path}")
 
@@ -400,9 +899,9 @@ def process_single_file(file_path, preview_only=False):
     print("Done.")
 
 
-def trim_directory_at_time(input_dir, cut_time):
+def trim_directory_at_time(input_dir, cut_time, jobs=None):
     """Trim all .mkv files in a directory at a specific time point"""
-    global log_file
+    global log_sink, ffmpeg_threads
     input_path = pathlib.Path(input_dir).resolve()
     
     if not input_path.exists():
@@ -413,12 +912,16 @@ def trim_directory_at_time(input_dir, cut_time):
         print(f"Error: '{input_path}' is not a directory")
         return
     
+    if jobs is None:
+        jobs = default_jobs()
+    if ffmpeg_threads is None:
+        ffmpeg_threads = _ffmpeg_threads_per_invocation(jobs)
+    
     # Create trimmed subdirectory in the input directory
     out_dir = input_path / "trimmed"
     out_dir.mkdir(exist_ok=True)
     
-    mkv_files = list(input_path.glob("*.mkv"))
-    mkv_files.sort()  # Sort files for consistent ordering
+    mkv_files = list_mkv_files(input_path)
     
     if not mkv_files:
         print(f"No .mkv files found in '{input_path}'")
@@ -427,23 +930,25 @@ def trim_directory_at_time(input_dir, cut_time):
     # Create log file for batch processing
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_path = input_path / f"trim_video_{timestamp}.log"
-    log_file = open(log_path, "w", encoding="utf-8")
+    log_sink = _LogSink(log_path)
     
     log(f"Trim Video Log - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     log(f"Directory: {input_path}")
     log(f"Found {len(mkv_files)} .mkv file(s)")
     log(f"Cut time: {format_time(cut_time)}")
+    log(f"Parallel jobs: {jobs} (ffmpeg threads per job: {ffmpeg_threads})")
     log(f"Output directory: {out_dir}\n")
     
-    for mkv in mkv_files:
-        trim_at_time(mkv, cut_time, out_dir)
+    # Close the sink even on error so queued messages still reach the log
+    try:
+        run_jobs(trim_at_time, mkv_files, jobs, cut_time=cut_time, out_dir=out_dir)
 
-    log("\n" + "="*60)
-    log("Done.")
-    log(f"Log saved to: {log_path}")
-    
-    log_file.close()
-    log_file = None
+        log("\n" + "="*60)
+        log("Done.")
+        log(f"Log saved to: {log_path}")
+    finally:
+        log_sink.close()
+        log_sink = None
     
     print(f"\n📄 Log saved to: {log_path}")
 
@@ -458,6 +963,7 @@ if __name__ == "__main__":
         print("  Manual cut at time:     python trim_video.py -t <time> -f <file.mkv>")
         print("                          python trim_video.py -t <time> <directory>")
         print("  Split by silence:       python trim_video.py -s -f <file.mkv>")
+        print("  Parallel directory run: python trim_video.py --jobs <n> <directory>")
         print("")
         print("Options:")
         print("  -f         Process a single file instead of a directory")
@@ -467,6 +973,11 @@ if __name__ == "__main__":
         print("             Can be used with a single file (-f) or a directory")
         print("  -s         Split mode: split video into segments at silence gaps")
         print("             Output files named as: filename_01.mkv, filename_02.mkv, ...")
+        print("  --jobs <n> Number of files processed in parallel in directory mode")
+        print("             (default: half the CPU cores)")
+        print("  --ffmpeg-threads <n>")
+        print("             Threads per ffmpeg process, 1-64 (default: CPU cores / jobs in")
+        print("             directory mode). Can also be set with TRIM_FFMPEG_THREADS")
         print("")
         print("Examples:")
         print("  python trim_video.py /path/to/videos")
@@ -478,6 +989,7 @@ if __name__ == "__main__":
         print("  python trim_video.py -t 10:30 /path/to/videos    # Cut all files at 10:30")
         print("  python trim_video.py -s -f /path/to/video.mkv    # Split by silence")
         print("  python trim_video.py -s -p -f /path/to/video.mkv # Preview split points")
+        print("  python trim_video.py --jobs 4 /path/to/videos    # Process 4 files at a time")
         sys.exit(1)
     
     # Parse arguments
@@ -499,13 +1011,46 @@ if __name__ == "__main__":
             print("Error: Please provide a time value after -t")
             sys.exit(1)
     
+    # Check for number of parallel jobs (--jobs)
+    jobs = None
+    if "--jobs" in sys.argv:
+        j_index = sys.argv.index("--jobs")
+        if j_index + 1 < len(sys.argv):
+            try:
+                jobs = int(sys.argv[j_index + 1])
+            except ValueError:
+                jobs = 0
+            if jobs < 1:
+                print(f"Error: Invalid --jobs value: {sys.argv[j_index + 1]}. Use a positive integer")
+                sys.exit(1)
+        else:
+            print("Error: Please provide a number after --jobs")
+            sys.exit(1)
+    
+    # Check for ffmpeg thread count (--ffmpeg-threads or TRIM_FFMPEG_THREADS)
+    threads_value = os.environ.get("TRIM_FFMPEG_THREADS")
+    if "--ffmpeg-threads" in sys.argv:
+        ft_index = sys.argv.index("--ffmpeg-threads")
+        if ft_index + 1 < len(sys.argv):
+            threads_value = sys.argv[ft_index + 1]
+        else:
+            print("Error: Please provide a number after --ffmpeg-threads")
+            sys.exit(1)
+    if threads_value is not None:
+        try:
+            ffmpeg_threads = parse_ffmpeg_threads(threads_value)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+    
     # Get the path (last argument that doesn't start with -)
     path_arg = None
     args_to_skip = set()
-    if "-t" in sys.argv:
-        t_index = sys.argv.index("-t")
-        args_to_skip.add(t_index)
-        args_to_skip.add(t_index + 1)
+    for opt in ("-t", "--jobs", "--ffmpeg-threads"):
+        if opt in sys.argv:
+            opt_index = sys.argv.index(opt)
+            args_to_skip.add(opt_index)
+            args_to_skip.add(opt_index + 1)
     
     for i, arg in enumerate(sys.argv[1:], 1):
         if i not in args_to_skip and not arg.startswith("-"):
@@ -515,41 +1060,47 @@ if __name__ == "__main__":
         print("Error: Please provide a path")
         sys.exit(1)
     
-    # Manual cut mode
-    if cut_time is not None:
-        if single_file:
-            # Single file mode
+    install_signal_handlers()
+    try:
+        # Manual cut mode
+        if cut_time is not None:
+            if single_file:
+                # Single file mode
+                file_path = pathlib.Path(path_arg).resolve()
+                if not file_path.exists():
+                    print(f"Error: File '{file_path}' does not exist")
+                    sys.exit(1)
+                
+                out_dir = file_path.parent / "trimmed"
+                out_dir.mkdir(exist_ok=True)
+                
+                trim_at_time(file_path, cut_time, out_dir)
+                print("Done.")
+            else:
+                # Directory mode - trim all files at the same time
+                trim_directory_at_time(path_arg, cut_time, jobs)
+        # Split mode
+        elif split_mode:
+            if not single_file:
+                print("Error: Split mode (-s) requires a single file (-f)")
+                sys.exit(1)
+            
             file_path = pathlib.Path(path_arg).resolve()
             if not file_path.exists():
                 print(f"Error: File '{file_path}' does not exist")
                 sys.exit(1)
             
             out_dir = file_path.parent / "trimmed"
-            out_dir.mkdir(exist_ok=True)
+            if not preview_only:
+                out_dir.mkdir(exist_ok=True)
             
-            trim_at_time(file_path, cut_time, out_dir)
+            split_by_silence(file_path, out_dir, preview_only)
             print("Done.")
+        elif single_file:
+            process_single_file(path_arg, preview_only)
         else:
-            # Directory mode - trim all files at the same time
-            trim_directory_at_time(path_arg, cut_time)
-    # Split mode
-    elif split_mode:
-        if not single_file:
-            print("Error: Split mode (-s) requires a single file (-f)")
-            sys.exit(1)
-        
-        file_path = pathlib.Path(path_arg).resolve()
-        if not file_path.exists():
-            print(f"Error: File '{file_path}' does not exist")
-            sys.exit(1)
-        
-        out_dir = file_path.parent / "trimmed"
-        if not preview_only:
-            out_dir.mkdir(exist_ok=True)
-        
-        split_by_silence(file_path, out_dir, preview_only)
-        print("Done.")
-    elif single_file:
-        process_single_file(path_arg, preview_only)
-    else:
-        process_directory(path_arg, preview_only)
\ No newline at end of file
+            process_directory(path_arg, preview_only, jobs)
+    except KeyboardInterrupt:
+        terminate_children()
+        print("\nInterrupted.")
+        sys.exit(130)